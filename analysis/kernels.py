@@ -0,0 +1,195 @@
+"""Numba-compiled numeric kernels behind the indicator and signal code.
+
+Kernels declare explicit signatures so they are compiled eagerly at import
+(and loaded from the on-disk cache afterwards) instead of on first call.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange, types
+
+# Close arrays arrive as float32 or float64, writable or read-only (pandas
+# copy-on-write views). Kernels accumulate in float64 regardless.
+_CLOSE_ARRAYS = tuple(
+    types.Array(dtype, 1, "C", readonly=readonly)
+    for dtype in (types.float32, types.float64)
+    for readonly in (False, True)
+)
+
+
+# Default indicator settings used by the batch kernel, matching analysis.technical.
+RSI_PERIOD = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL_PERIOD = 9
+EMA_PERIOD = 20
+BB_PERIOD = 20
+BB_NUM_STD = 2.0
+TREND_SHORT = 50
+TREND_LONG = 200
+BUY_THRESHOLD = 0.6
+SELL_THRESHOLD = 0.4
+
+# Row layout of the signal_batch output (one contiguous row per field).
+SCORE, RSI, EMA, MACD, MACD_SIGNAL, MACD_HIST, BB_UPPER, BB_SMA, BB_LOWER, TREND = range(10)
+N_OUTPUTS = 10
+
+
+def as_close_array(values) -> np.ndarray:
+    """Coerce closes to a contiguous float32/float64 array accepted by the kernels."""
+    values = np.asarray(values)
+    return np.ascontiguousarray(values, dtype=values.dtype if values.dtype == np.float32 else np.float64)
+
+
+@njit(cache=True, nogil=True)
+def _recursions(close, start, rsi_period, macd_fast, macd_slow, macd_signal_period, ema_period):
+    n = close.shape[0]
+    if n <= start:
+        return np.nan, np.nan, np.nan, np.nan, np.nan, np.nan
+    a_fast = 2.0 / (macd_fast + 1)
+    a_slow = 2.0 / (macd_slow + 1)
+    a_signal = 2.0 / (macd_signal_period + 1)
+    a_ema = 2.0 / (ema_period + 1)
+    a_rsi = 1.0 / rsi_period
+
+    ema_fast = np.float64(close[start])
+    ema_slow = ema_fast
+    ema = ema_fast
+    macd_signal = 0.0
+    avg_gain = np.nan
+    avg_loss = np.nan
+    for i in range(start + 1, n):
+        c = np.float64(close[i])
+        ema_fast += a_fast * (c - ema_fast)
+        ema_slow += a_slow * (c - ema_slow)
+        macd_signal += a_signal * (ema_fast - ema_slow - macd_signal)
+        ema += a_ema * (c - ema)
+
+        delta = c - np.float64(close[i - 1])
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        if i == start + 1:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain += a_rsi * (gain - avg_gain)
+            avg_loss += a_rsi * (loss - avg_loss)
+    return ema_fast, ema_slow, macd_signal, ema, avg_gain, avg_loss
+
+
+@njit(cache=True, nogil=True)
+def _tail_mean_std(close, start, window):
+    n = close.shape[0]
+    if n - start < window:
+        return np.nan, np.nan
+    total = 0.0
+    for i in range(n - window, n):
+        total += close[i]
+    mean = total / window
+    sq = 0.0
+    for i in range(n - window, n):
+        sq += (np.float64(close[i]) - mean) ** 2
+    return mean, np.sqrt(sq / (window - 1))
+
+
+@njit(cache=True, nogil=True)
+def _tail_mean(close, start, window):
+    n = close.shape[0]
+    if n - start < window:
+        return np.nan
+    total = 0.0
+    for i in range(n - window, n):
+        total += close[i]
+    return total / window
+
+
+@njit(cache=True, nogil=True)
+def _trend_code(close, start, short, long):
+    ma_short = _tail_mean(close, start, short)
+    ma_long = _tail_mean(close, start, long)
+    return 1 if ma_short > ma_long else -1 if ma_short < ma_long else 0
+
+
+@njit(cache=True, nogil=True)
+def _rsi(avg_gain, avg_loss):
+    if avg_loss == 0.0:
+        return 100.0 if avg_gain > 0.0 else np.nan
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(
+    [types.UniTuple(types.float64, 6)(arr, *(types.int64,) * 5) for arr in _CLOSE_ARRAYS],
+    cache=True,
+    nogil=True,
+)
+def indicator_pass(close, rsi_period, macd_fast, macd_slow, macd_signal_period, ema_period):
+    """Fused single pass over ``close`` returning the recursive indicator state.
+
+    Returns ``(ema_fast, ema_slow, macd_signal, ema, rsi_avg_gain, rsi_avg_loss)``.
+    """
+    return _recursions(close, 0, rsi_period, macd_fast, macd_slow, macd_signal_period, ema_period)
+
+
+@njit([types.int64(arr, types.int64, types.int64) for arr in _CLOSE_ARRAYS], cache=True, nogil=True)
+def trend_code(close, short, long):
+    """Moving-average crossover regime: 1 bull, -1 bear, 0 neutral or too little history."""
+    return _trend_code(close, 0, short, long)
+
+
+@njit("float64(float64, float64, float64, int64)", cache=True, nogil=True)
+def blend_score(ai_score, sentiment, rsi_val, trend):
+    """Blend AI score, sentiment, RSI and trend (-1/0/1) into a confidence score."""
+    score = ai_score * 0.4 + sentiment * 0.2 + (100 - abs(rsi_val - 50)) / 100 * 0.2
+    return score + trend * 0.2
+
+
+@njit("int8(float64)", cache=True, nogil=True)
+def direction_code(score):
+    """Map a confidence score to 1 buy, -1 sell or 0 hold."""
+    return 1 if score > BUY_THRESHOLD else -1 if score < SELL_THRESHOLD else 0
+
+
+@njit(
+    "void(float32[:, :], float32[::1], float32[::1], float32[:, ::1], int8[::1])",
+    cache=True,
+    parallel=True,
+)
+def signal_batch(prices, ai_scores, sentiments, out, directions):
+    """Score every column of a ``(T, N)`` close matrix into ``out[N_OUTPUTS, N]``.
+
+    ``directions[N]`` receives the int8 direction code for each symbol.
+
+    ``prices`` should be Fortran-ordered so each symbol's series is one
+    contiguous column; the signature accepts any layout because numba types
+    single-column and single-row matrices as C-contiguous. Rows are
+    oldest-first; shorter histories are NaN-padded at the top. Inputs and
+    outputs are float32; intermediate sums are float64.
+    """
+    n_rows, n_symbols = prices.shape
+    for j in prange(n_symbols):
+        col = prices[:, j]
+        start = 0
+        while start < n_rows and np.isnan(col[start]):
+            start += 1
+
+        ema_fast, ema_slow, macd_signal, ema, avg_gain, avg_loss = _recursions(
+            col, start, RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL_PERIOD, EMA_PERIOD
+        )
+        rsi_val = _rsi(avg_gain, avg_loss)
+        bb_sma, bb_std = _tail_mean_std(col, start, BB_PERIOD)
+        trend = _trend_code(col, start, TREND_SHORT, TREND_LONG)
+
+        macd_line = ema_fast - ema_slow
+        score = blend_score(ai_scores[j], sentiments[j], rsi_val, trend)
+        out[SCORE, j] = score
+        directions[j] = direction_code(score)
+        out[RSI, j] = rsi_val
+        out[EMA, j] = ema
+        out[MACD, j] = macd_line
+        out[MACD_SIGNAL, j] = macd_signal
+        out[MACD_HIST, j] = macd_line - macd_signal
+        out[BB_UPPER, j] = bb_sma + BB_NUM_STD * bb_std
+        out[BB_SMA, j] = bb_sma
+        out[BB_LOWER, j] = bb_sma - BB_NUM_STD * bb_std
+        out[TREND, j] = trend
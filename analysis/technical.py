@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import math
+from collections import deque
+from dataclasses import dataclass, field
+
 import numpy as np
 import pandas as pd
 
+from analysis.kernels import EMA_PERIOD, RSI_PERIOD, as_close_array, indicator_pass
+
 
 def rsi(series: pd.Series, period: int = 14) -> pd.Series:
     delta = series.diff()
@@ -49,3 +55,131 @@ def fibonacci_levels(high: float, low: float) -> dict:
         "0.5": high - 0.5 * diff,
         "0.618": high - 0.618 * diff,
     }
+
+
+def macd_last(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple[float, float, float]:
+    """Last row of ``macd`` as ``(macd, signal, histogram)`` without building the series."""
+    ema_fast, ema_slow, signal_line, *_ = indicator_pass(
+        as_close_array(close), RSI_PERIOD, fast, slow, signal, EMA_PERIOD
+    )
+    macd_line = ema_fast - ema_slow
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def bollinger_last(close: np.ndarray, period: int = 20, num_std: float = 2.0) -> tuple[float, float, float]:
+    """Last row of ``bollinger_bands`` as ``(upper, sma, lower)`` from the trailing window only."""
+    if len(close) < period:
+        return math.nan, math.nan, math.nan
+    window = np.asarray(close[-period:], dtype=np.float64)
+    sma = float(window.mean())
+    std = float(window.std(ddof=1))
+    return sma + num_std * std, sma, sma - num_std * std
+
+
+@dataclass
+class IndicatorState:
+    """Streaming RSI/MACD/EMA/Bollinger state with O(1) updates per close.
+
+    Uses the default periods of the functions above and reproduces their
+    last values without recomputing over the full series.
+    """
+
+    rsi_period: int = 14
+    macd_fast: int = 12
+    macd_slow: int = 26
+    macd_signal_period: int = 9
+    ema_period: int = 20
+    bb_period: int = 20
+    bb_num_std: float = 2.0
+    count: int = 0
+    prev_close: float = math.nan
+    ema_fast: float = math.nan
+    ema_slow: float = math.nan
+    macd_signal: float = math.nan
+    ema: float = math.nan
+    rsi_avg_gain: float = math.nan
+    rsi_avg_loss: float = math.nan
+    bb_mean: float = 0.0
+    bb_m2: float = 0.0
+    bb_window: deque = field(default_factory=deque)
+
+    @classmethod
+    def from_closes(cls, closes: np.ndarray, **periods) -> "IndicatorState":
+        state = cls(**periods)
+        closes = as_close_array(closes)
+        if closes.size == 0:
+            return state
+        (
+            state.ema_fast,
+            state.ema_slow,
+            state.macd_signal,
+            state.ema,
+            state.rsi_avg_gain,
+            state.rsi_avg_loss,
+        ) = indicator_pass(
+            closes, state.rsi_period, state.macd_fast, state.macd_slow, state.macd_signal_period, state.ema_period
+        )
+        window = closes[-state.bb_period:].astype(np.float64)
+        state.bb_window = deque(window.tolist())
+        state.bb_mean = float(window.mean())
+        state.bb_m2 = float(((window - state.bb_mean) ** 2).sum())
+        state.prev_close = float(closes[-1])
+        state.count = int(closes.size)
+        return state
+
+    def update(self, close: float) -> None:
+        close = float(close)
+        if self.count == 0:
+            self.ema_fast = self.ema_slow = self.ema = close
+            self.macd_signal = 0.0
+        else:
+            self.ema_fast += 2.0 / (self.macd_fast + 1) * (close - self.ema_fast)
+            self.ema_slow += 2.0 / (self.macd_slow + 1) * (close - self.ema_slow)
+            self.macd_signal += 2.0 / (self.macd_signal_period + 1) * (
+                self.ema_fast - self.ema_slow - self.macd_signal
+            )
+            self.ema += 2.0 / (self.ema_period + 1) * (close - self.ema)
+
+            delta = close - self.prev_close
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+            if self.count == 1:
+                self.rsi_avg_gain, self.rsi_avg_loss = gain, loss
+            else:
+                alpha = 1.0 / self.rsi_period
+                self.rsi_avg_gain += alpha * (gain - self.rsi_avg_gain)
+                self.rsi_avg_loss += alpha * (loss - self.rsi_avg_loss)
+
+        # Welford mean/M2 over the rolling window: add while filling, then swap oldest for newest.
+        self.bb_window.append(close)
+        if len(self.bb_window) > self.bb_period:
+            old = self.bb_window.popleft()
+            mean = self.bb_mean + (close - old) / self.bb_period
+            self.bb_m2 += (close - old) * (close - mean + old - self.bb_mean)
+            self.bb_mean = mean
+        else:
+            delta = close - self.bb_mean
+            self.bb_mean += delta / len(self.bb_window)
+            self.bb_m2 += delta * (close - self.bb_mean)
+
+        self.prev_close = close
+        self.count += 1
+
+    @property
+    def rsi(self) -> float:
+        if self.rsi_avg_loss == 0:
+            return 100.0 if self.rsi_avg_gain > 0 else math.nan
+        return 100 - (100 / (1 + self.rsi_avg_gain / self.rsi_avg_loss))
+
+    @property
+    def macd(self) -> tuple[float, float, float]:
+        macd_line = self.ema_fast - self.ema_slow
+        return macd_line, self.macd_signal, macd_line - self.macd_signal
+
+    @property
+    def bollinger(self) -> tuple[float, float, float]:
+        n = self.bb_period
+        if len(self.bb_window) < n:
+            return math.nan, math.nan, math.nan
+        sma = self.bb_mean
+        std = math.sqrt(max(self.bb_m2, 0.0) / (n - 1))
+        return sma + self.bb_num_std * std, sma, sma - self.bb_num_std * std
@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 
-import pandas as pd
+import numpy as np
 
+from analysis.kernels import as_close_array, trend_code
 
-def detect_trend(price_series: pd.Series, short: int = 50, long: int = 200) -> str:
+_REGIMES = {1: "bull", -1: "bear", 0: "neutral"}
+
+
+def detect_trend(price_series: np.ndarray, short: int = 50, long: int = 200) -> str:
     """Simple moving-average crossover regime detection."""
-    ma_short = price_series.rolling(window=short).mean()
-    ma_long = price_series.rolling(window=long).mean()
-    if ma_short.iloc[-1] > ma_long.iloc[-1]:
-        return "bull"
-    if ma_short.iloc[-1] < ma_long.iloc[-1]:
-        return "bear"
-    return "neutral"
+    return _REGIMES[trend_code(as_close_array(price_series), short, long)]
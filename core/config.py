@@ -13,6 +13,8 @@ class Settings(BaseSettings):
     smtp_port: int = Field(587, env="SMTP_PORT")
     smtp_user: str = Field(..., env="SMTP_USER")
     smtp_password: str = Field(..., env="SMTP_PASSWORD")
+    vision_endpoint: str = Field("", env="VISION_ENDPOINT")
+    vision_api_key: str = Field("", env="VISION_API_KEY")
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,61 @@
+"""Shared async HTTP client so API calls reuse pooled keep-alive connections."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+# Upper bound on concurrent connections; gathered requests beyond it queue in the pool.
+MAX_CONNECTIONS = 64
+# Attempts made for a rate-limited (HTTP 429) request before giving up.
+MAX_ATTEMPTS = 4
+# Longest wait honoured between 429 retries, whatever Retry-After says.
+MAX_RETRY_DELAY = 60.0
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS),
+            timeout=pooled_timeout(5.0),
+        )
+    return _client
+
+
+def pooled_timeout(seconds: float) -> httpx.Timeout:
+    """Per-request timeout that still waits indefinitely for a free pooled connection."""
+    return httpx.Timeout(seconds, pool=None)
+
+
+async def get_with_retry(url: str, **kwargs) -> httpx.Response:
+    """GET through the shared client, backing off exponentially on HTTP 429."""
+    client = get_http_client()
+    if isinstance(kwargs.get("timeout"), (int, float)):
+        kwargs["timeout"] = pooled_timeout(kwargs["timeout"])
+    for attempt in range(MAX_ATTEMPTS - 1):
+        resp = await client.get(url, **kwargs)
+        if resp.status_code != 429:
+            return resp
+        await asyncio.sleep(_retry_delay(resp, attempt))
+    return await client.get(url, **kwargs)
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    try:
+        delay = float(resp.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = float(2 ** attempt)
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its connection pool."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
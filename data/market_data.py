@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
-import httpx
+import asyncio
+
+import numpy as np
+import orjson
 
 from core.config import settings
+from core.http import get_with_retry
+
+# Bars requested per symbol: the 200-day trend window plus indicator warm-up.
+PRICE_HISTORY_BARS = 250
+# TwelveData accepts at most 120 symbols per batch request.
+PRICE_BATCH_SIZE = 120
 
 
 async def fetch_top_tickers(limit: int = 10) -> list[str]:
@@ -12,10 +21,9 @@ async def fetch_top_tickers(limit: int = 10) -> list[str]:
     url = "https://api.danelfin.com/v1/tickers/top"
     params = {"limit": limit}
     headers = {"Authorization": f"Bearer {settings.danelfin_api_key}"}
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(url, params=params, headers=headers, timeout=30)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await get_with_retry(url, params=params, headers=headers, timeout=30)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
     return [item["symbol"] for item in data.get("tickers", [])]
 
 
@@ -25,22 +33,66 @@ async def fetch_price_data(symbol: str) -> dict:
     td_params = {
         "symbol": symbol,
         "interval": "1day",
-        "outputsize": 500,
+        "outputsize": PRICE_HISTORY_BARS,
         "apikey": settings.twelvedata_api_key,
     }
-    async with httpx.AsyncClient() as client:
-        td_resp = await client.get(td_url, params=td_params)
-        if td_resp.status_code == 200 and "values" in td_resp.json():
-            return td_resp.json()
-        av_url = "https://www.alphavantage.co/query"
-        av_params = {
-            "function": "TIME_SERIES_DAILY_ADJUSTED",
-            "symbol": symbol,
-            "apikey": settings.alphavantage_api_key,
-        }
-        av_resp = await client.get(av_url, params=av_params)
-        av_resp.raise_for_status()
-        return av_resp.json()
+    td_resp = await get_with_retry(td_url, params=td_params)
+    if td_resp.status_code == 200:
+        payload = orjson.loads(td_resp.content)
+        if "values" in payload:
+            return payload
+    return await _fetch_alphavantage_daily(symbol)
+
+
+async def fetch_price_data_batch(symbols: list[str]) -> dict[str, dict]:
+    """Fetch daily price data for many symbols in chunked TwelveData batch requests.
+
+    Symbols TwelveData cannot serve fall back to AlphaVantage individually.
+    """
+    chunks = [symbols[i:i + PRICE_BATCH_SIZE] for i in range(0, len(symbols), PRICE_BATCH_SIZE)]
+    results = {}
+    for chunk_results in await asyncio.gather(*(_fetch_twelvedata_batch(chunk) for chunk in chunks)):
+        results.update(chunk_results)
+    missing = [s for s in symbols if s not in results]
+    fallbacks = await asyncio.gather(*(_fetch_alphavantage_daily(s) for s in missing))
+    results.update(zip(missing, fallbacks))
+    return results
+
+
+async def _fetch_twelvedata_batch(symbols: list[str]) -> dict[str, dict]:
+    td_url = "https://api.twelvedata.com/time_series"
+    td_params = {
+        "symbol": ",".join(symbols),
+        "interval": "1day",
+        "outputsize": PRICE_HISTORY_BARS,
+        "apikey": settings.twelvedata_api_key,
+    }
+    td_resp = await get_with_retry(td_url, params=td_params)
+    payload = orjson.loads(td_resp.content) if td_resp.status_code == 200 else {}
+    if len(symbols) == 1:
+        # Single-symbol responses are not keyed by symbol.
+        payload = {symbols[0]: payload}
+    return {s: payload[s] for s in symbols if "values" in payload.get(s, {})}
+
+
+async def _fetch_alphavantage_daily(symbol: str) -> dict:
+    av_url = "https://www.alphavantage.co/query"
+    av_params = {
+        "function": "TIME_SERIES_DAILY_ADJUSTED",
+        "symbol": symbol,
+        "apikey": settings.alphavantage_api_key,
+    }
+    av_resp = await get_with_retry(av_url, params=av_params)
+    av_resp.raise_for_status()
+    return orjson.loads(av_resp.content)
+
+
+def parse_closes(price_data: dict) -> np.ndarray:
+    """Extract oldest-first daily closes from a TwelveData or AlphaVantage payload."""
+    if "values" in price_data:
+        return np.array([bar["close"] for bar in reversed(price_data["values"])], dtype=np.float32)
+    ts = price_data.get("Time Series (Daily)", {})
+    return np.array([ts[day]["4. close"] for day in sorted(ts)], dtype=np.float32)
 
 
 async def fetch_news_sentiment(symbol: str) -> dict:
@@ -51,17 +103,15 @@ async def fetch_news_sentiment(symbol: str) -> dict:
         "tickers": symbol,
         "apikey": settings.alphavantage_api_key,
     }
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json()
+    resp = await get_with_retry(url, params=params)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
 
 
 async def fetch_chart_snapshot(symbol: str) -> bytes:
     """Optionally retrieve a chart image via the Chart-img API."""
     url = "https://api.chart-img.com/v1/tradingview/advanced-chart"
     params = {"symbol": symbol, "interval": "D"}
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(url, params=params, timeout=60)
-        resp.raise_for_status()
-        return resp.content
+    resp = await get_with_retry(url, params=params, timeout=60)
+    resp.raise_for_status()
+    return resp.content
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import alpaca_trade_api as tradeapi
 
 from core.config import settings
 
 
+@lru_cache(maxsize=1)
 def get_client() -> tradeapi.REST:
     return tradeapi.REST(key_id=settings.alpaca_api_key, secret_key=settings.alpaca_api_secret, base_url="https://paper-api.alpaca.markets")
 
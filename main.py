@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-import pandas as pd
+import time
+
+import numpy as np
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from core.config import settings
 from core.database import Database
-from data.market_data import fetch_top_tickers, fetch_price_data, fetch_news_sentiment, fetch_chart_snapshot
+from core.http import close_http_client
+from data.market_data import fetch_top_tickers, fetch_price_data_batch, fetch_news_sentiment, fetch_chart_snapshot, parse_closes
 from analysis.vision import describe_chart
-from strategy.signals import generate_signal
-from strategy.risk import position_size, should_trade
+from strategy.signals import generate_signals_batch, stack_closes
+from strategy.risk import position_sizes, should_trade_mask
 from execution.trading import get_account, place_order
 from reporting.reports import generate_report, send_email
 
@@ -20,45 +23,46 @@ from reporting.reports import generate_report, send_email
 db = Database(settings.postgres_dsn)
 
 
+async def fetch_sentiment_score(symbol: str) -> float:
+    sentiment_data = await fetch_news_sentiment(symbol)
+    return sentiment_data.get("overall_sentiment_score", 0)
+
+
+async def analyze_chart(symbol: str) -> None:
+    # Optional chart analysis via LLM vision
+    try:
+        chart_img = await fetch_chart_snapshot(symbol)
+        _ = await describe_chart(chart_img, settings.vision_endpoint, settings.vision_api_key)
+    except Exception:
+        pass
+
+
 async def daily_workflow() -> None:
-    tickers = await fetch_top_tickers()
-    signals = []
-    trades = []
-    account = get_account()
+    cycle_start = time.time()
+    tickers, account = await asyncio.gather(fetch_top_tickers(), asyncio.to_thread(get_account))
     balance = float(account.cash)
     loss_ledger = {}
 
-    for symbol in tickers:
-        if not should_trade(symbol, loss_ledger):
-            continue
-        price_data = await fetch_price_data(symbol)
-        price_df = None
-        if "values" in price_data:
-            price_df = pd.DataFrame(price_data["values"]).iloc[::-1]
-        else:
-            ts = price_data.get("Time Series (Daily)", {})
-            price_df = pd.DataFrame([
-                {"date": k, **v} for k, v in ts.items()
-            ]).sort_values("date")
-        sentiment_data = await fetch_news_sentiment(symbol)
-        sentiment_score = sentiment_data.get("overall_sentiment_score", 0)
-        ai_score = 0.0  # placeholder for Danelfin score which isn't returned in top-tickers endpoint
-
-        # Optional chart analysis via LLM vision
-        try:
-            chart_img = await fetch_chart_snapshot(symbol)
-            _ = await describe_chart(chart_img, "https://example.com/vision", "demo")
-        except Exception:
-            pass
-
-        signal = generate_signal(symbol, price_df, ai_score, sentiment_score)
-        signals.append(signal)
-
-        if signal.direction in {"buy", "sell"}:
-            stop_loss_distance = 1  # placeholder
-            qty = position_size(balance, 0.01, stop_loss_distance)
-            place_order(symbol, int(qty), signal.direction)
-            trades.append(f"{signal.direction} {qty} {symbol}")
+    symbols = [symbol for symbol, ok in zip(tickers, should_trade_mask(tickers, loss_ledger, now=cycle_start)) if ok]
+    price_data, *sentiments = await asyncio.gather(
+        fetch_price_data_batch(symbols), *(fetch_sentiment_score(symbol) for symbol in symbols)
+    )
+    if settings.vision_endpoint:
+        await asyncio.gather(*(analyze_chart(symbol) for symbol in symbols))
+    closes = [parse_closes(price_data[symbol]) for symbol in symbols]
+
+    ai_scores = np.zeros(len(symbols), dtype=np.float32)  # placeholder for Danelfin score which isn't returned in top-tickers endpoint
+    batch = generate_signals_batch(symbols, stack_closes(closes), ai_scores, np.array(sentiments, dtype=np.float32))
+    signals = batch.to_signals()
+
+    orders = [signals[i] for i in np.flatnonzero(batch.direction)]
+    stop_loss_distances = np.ones(len(orders))  # placeholder
+    quantities = position_sizes(balance, 0.01, stop_loss_distances)
+    # The Alpaca SDK is blocking; place orders from worker threads so they overlap.
+    await asyncio.gather(
+        *(asyncio.to_thread(place_order, signal.symbol, int(qty), signal.direction) for signal, qty in zip(orders, quantities))
+    )
+    trades = [f"{signal.direction} {qty} {signal.symbol}" for signal, qty in zip(orders, quantities)]
 
     report = generate_report(signals, trades, 0.0)
     send_email("Daily Market Report", report, [settings.smtp_user])
@@ -73,6 +77,8 @@ async def main() -> None:
         await asyncio.Event().wait()
     except (KeyboardInterrupt, SystemExit):
         pass
+    finally:
+        await close_http_client()
 
 
 if __name__ == "__main__":
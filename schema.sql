@@ -31,6 +31,8 @@ CREATE TABLE IF NOT EXISTS trades (
     pnl REAL
 );
 
+-- strategy.risk.should_trade expects last_loss as Unix epoch seconds; load it with
+-- EXTRACT(EPOCH FROM last_loss)::float8 rather than as a datetime.
 CREATE TABLE IF NOT EXISTS loss_ledger (
     symbol TEXT PRIMARY KEY,
     last_loss TIMESTAMP
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
+from typing import Sequence
 
+import numpy as np
 
-@dataclass
+_SECONDS_PER_DAY = 86400.0
+
+
+@dataclass(slots=True, frozen=True)
 class Position:
     symbol: str
     size: float
@@ -15,15 +21,35 @@ class Position:
 
 def position_size(account_balance: float, risk_perc: float, stop_loss_distance: float) -> float:
     """Calculate position size based on account balance and risk percentage."""
+    return float(position_sizes(account_balance, risk_perc, np.array([stop_loss_distance], dtype=np.float64))[0])
+
+
+def position_sizes(account_balance: float, risk_perc: float, stop_loss_distances: np.ndarray) -> np.ndarray:
+    """Vectorized ``position_size`` over many stop-loss distances; non-positive distances size to zero."""
+    stop_loss_distances = np.asarray(stop_loss_distances, dtype=np.float64)
     risk_amount = account_balance * risk_perc
-    return risk_amount / stop_loss_distance if stop_loss_distance else 0
+    return np.where(stop_loss_distances > 0, risk_amount / np.maximum(stop_loss_distances, 1e-12), 0.0)
 
 
-def should_trade(symbol: str, loss_ledger: dict[str, float], cooldown_days: int = 5) -> bool:
-    """No-repeat-loss policy: avoid symbols that lost recently."""
-    from datetime import datetime, timedelta
+def should_trade(
+    symbol: str, loss_ledger: dict[str, float], cooldown_days: int = 5, now: float | None = None
+) -> bool:
+    """No-repeat-loss policy: avoid symbols that lost recently.
 
+    ``loss_ledger`` maps symbols to the Unix timestamp of their last loss. The
+    ``loss_ledger.last_loss`` column is a TIMESTAMP, which asyncpg returns as a
+    datetime; select it as ``EXTRACT(EPOCH FROM last_loss)::float8`` when loading.
+    Pass ``now`` to evaluate a whole cycle against one timestamp.
+    """
     last_loss = loss_ledger.get(symbol)
-    if not last_loss:
+    if last_loss is None:
         return True
-    return datetime.utcnow() - last_loss > timedelta(days=cooldown_days)
+    return (time.time() if now is None else now) - last_loss > cooldown_days * _SECONDS_PER_DAY
+
+
+def should_trade_mask(
+    symbols: Sequence[str], loss_ledger: dict[str, float], cooldown_days: int = 5, now: float | None = None
+) -> np.ndarray:
+    """Vectorized ``should_trade`` over a universe of symbols; ledger values are epoch seconds."""
+    last_loss = np.fromiter((loss_ledger.get(s, -np.inf) for s in symbols), dtype=np.float64, count=len(symbols))
+    return (time.time() if now is None else now) - last_loss > cooldown_days * _SECONDS_PER_DAY
@@ -3,36 +3,161 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Sequence
 
+import numpy as np
 import pandas as pd
 
-from analysis.technical import rsi, macd, ema, bollinger_bands
-from analysis.trend import detect_trend
+from analysis import kernels
+from analysis.kernels import TREND_LONG, TREND_SHORT, blend_score, direction_code, trend_code
+from analysis.technical import IndicatorState
 
 
-@dataclass
+# Direction labels indexed by ``code + 1`` for the -1/0/1 kernel codes.
+DIRECTIONS = ("sell", "hold", "buy")
+
+
+@dataclass(slots=True, frozen=True)
+class Technicals:
+    rsi: float
+    ema: float
+    macd_line: float
+    macd_signal: float
+    macd_hist: float
+    bb_upper: float
+    bb_sma: float
+    bb_lower: float
+    trend: int  # 1 bull, -1 bear, 0 neutral
+
+
+@dataclass(slots=True, frozen=True)
 class Signal:
     symbol: str
     direction: str
     confidence: float
-    technicals: Dict[str, Any]
+    technicals: Technicals
     sentiment: float
     ai_score: float
 
 
 def generate_signal(symbol: str, price_df: pd.DataFrame, ai_score: float, sentiment: float) -> Signal:
     """Generate trading signal by blending multiple inputs."""
-    close = price_df["close"].astype(float)
-    rsi_val = rsi(close).iloc[-1]
-    macd_vals = macd(close).iloc[-1].to_dict()
-    ema_val = ema(close).iloc[-1]
-    bb_vals = bollinger_bands(close).iloc[-1].to_dict()
-    trend = detect_trend(close)
-
-    score = ai_score * 0.4 + sentiment * 0.2 + (100 - abs(rsi_val - 50)) / 100 * 0.2
-    score += (1 if trend == "bull" else -1 if trend == "bear" else 0) * 0.2
-    direction = "buy" if score > 0.6 else "sell" if score < 0.4 else "hold"
-
-    technicals = {"rsi": rsi_val, "ema": ema_val, "macd": macd_vals, "bollinger": bb_vals, "trend": trend}
+    close = price_df["close"].astype(np.float32).to_numpy()
+    state = IndicatorState.from_closes(close)
+    trend = trend_code(close, TREND_SHORT, TREND_LONG)
+    score = blend_score(ai_score, sentiment, state.rsi, trend)
+    direction = DIRECTIONS[direction_code(score) + 1]
+
+    technicals = Technicals(state.rsi, state.ema, *state.macd, *state.bollinger, trend)
     return Signal(symbol=symbol, direction=direction, confidence=score, technicals=technicals, sentiment=sentiment, ai_score=ai_score)
+
+
+def stack_closes(closes: Sequence[np.ndarray]) -> np.ndarray:
+    """Stack oldest-first close arrays into a column-major ``(T, N)`` matrix.
+
+    Closes are stored as float32; shorter histories are NaN-padded at the top and
+    each symbol's column is contiguous.
+    """
+    length = max((len(c) for c in closes), default=0)
+    matrix = np.full((length, len(closes)), np.nan, dtype=np.float32, order="F")
+    for j, close in enumerate(closes):
+        if len(close):
+            matrix[-len(close):, j] = close
+    return matrix
+
+
+@dataclass(slots=True)
+class SignalBatch:
+    """Columnar signals for a universe: one array per field, indexed by symbol position.
+
+    ``direction`` and ``trend`` hold int8 codes (1, 0, -1); see ``DIRECTIONS``.
+    """
+
+    symbols: np.ndarray
+    direction: np.ndarray
+    confidence: np.ndarray
+    rsi: np.ndarray
+    ema: np.ndarray
+    macd_line: np.ndarray
+    macd_signal: np.ndarray
+    macd_hist: np.ndarray
+    bb_upper: np.ndarray
+    bb_sma: np.ndarray
+    bb_lower: np.ndarray
+    trend: np.ndarray
+    sentiment: np.ndarray
+    ai_score: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def top_k(self, k: int) -> np.ndarray:
+        """Indices of the ``k`` highest-confidence signals, best first."""
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        confidence = np.where(np.isnan(self.confidence), -np.inf, self.confidence)
+        idx = np.argpartition(confidence, -k)[-k:]
+        return idx[np.argsort(confidence[idx])[::-1]]
+
+    def signal(self, i: int) -> Signal:
+        technicals = Technicals(
+            rsi=float(self.rsi[i]),
+            ema=float(self.ema[i]),
+            macd_line=float(self.macd_line[i]),
+            macd_signal=float(self.macd_signal[i]),
+            macd_hist=float(self.macd_hist[i]),
+            bb_upper=float(self.bb_upper[i]),
+            bb_sma=float(self.bb_sma[i]),
+            bb_lower=float(self.bb_lower[i]),
+            trend=int(self.trend[i]),
+        )
+        return Signal(
+            symbol=str(self.symbols[i]),
+            direction=DIRECTIONS[self.direction[i] + 1],
+            confidence=float(self.confidence[i]),
+            technicals=technicals,
+            sentiment=float(self.sentiment[i]),
+            ai_score=float(self.ai_score[i]),
+        )
+
+    def to_signals(self) -> list[Signal]:
+        return [self.signal(i) for i in range(len(self))]
+
+
+def generate_signals_batch(
+    symbols: Sequence[str], price_matrix: np.ndarray, ai_scores: np.ndarray, sentiments: np.ndarray
+) -> SignalBatch:
+    """Generate signals for a whole universe from a ``(T, N)`` close matrix in one kernel call."""
+    price_matrix = np.asfortranarray(price_matrix, dtype=np.float32)
+    ai_scores = np.ascontiguousarray(ai_scores, dtype=np.float32)
+    sentiments = np.ascontiguousarray(sentiments, dtype=np.float32)
+    # The kernel does not bounds-check, so mismatched sizes would read and write out of range.
+    if price_matrix.ndim != 2:
+        raise ValueError(f"price_matrix must be 2-D (T, N), got shape {price_matrix.shape}")
+    if not price_matrix.shape[1] == len(symbols) == len(ai_scores) == len(sentiments):
+        raise ValueError(
+            f"size mismatch: {price_matrix.shape[1]} price columns, {len(symbols)} symbols, "
+            f"{len(ai_scores)} AI scores, {len(sentiments)} sentiments"
+        )
+    out = np.empty((kernels.N_OUTPUTS, len(symbols)), dtype=np.float32)
+    directions = np.empty(len(symbols), dtype=np.int8)
+    if len(symbols):
+        kernels.signal_batch(price_matrix, ai_scores, sentiments, out, directions)
+
+    return SignalBatch(
+        symbols=np.array(symbols, dtype=object),
+        direction=directions,
+        confidence=out[kernels.SCORE],
+        rsi=out[kernels.RSI],
+        ema=out[kernels.EMA],
+        macd_line=out[kernels.MACD],
+        macd_signal=out[kernels.MACD_SIGNAL],
+        macd_hist=out[kernels.MACD_HIST],
+        bb_upper=out[kernels.BB_UPPER],
+        bb_sma=out[kernels.BB_SMA],
+        bb_lower=out[kernels.BB_LOWER],
+        trend=out[kernels.TREND].astype(np.int8),
+        sentiment=sentiments,
+        ai_score=ai_scores,
+    )
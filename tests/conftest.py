@@ -0,0 +1,37 @@
+import os
+
+import httpx
+import pytest
+
+# core.config builds Settings at import time; give the required fields dummy values.
+for _name in (
+    "DANELFIN_API_KEY",
+    "ALPHAVANTAGE_API_KEY",
+    "ALPACA_API_KEY",
+    "ALPACA_SECRET",
+    "POSTGRES_DSN",
+    "SMTP_SERVER",
+    "SMTP_USER",
+    "SMTP_PASSWORD",
+):
+    os.environ.setdefault(_name, "test")
+
+from core import http  # noqa: E402
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Route the shared HTTP client through ``handler`` and record each request sent."""
+    requests = []
+
+    def install(handler):
+        def record(request):
+            requests.append(request)
+            return handler(request)
+
+        monkeypatch.setattr(
+            http, "_client", httpx.AsyncClient(transport=httpx.MockTransport(record), timeout=http.pooled_timeout(5.0))
+        )
+        return requests
+
+    return install
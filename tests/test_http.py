@@ -0,0 +1,68 @@
+import asyncio
+
+import httpx
+import pytest
+
+from core import http
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(http.asyncio, "sleep", sleep)
+    return delays
+
+
+def _responses(*responses):
+    remaining = iter(responses)
+    return lambda request: next(remaining)
+
+
+def test_retries_after_429(mock_http, sleeps):
+    requests = mock_http(_responses(httpx.Response(429, headers={"Retry-After": "3"}), httpx.Response(200)))
+    resp = asyncio.run(http.get_with_retry("https://example.com"))
+
+    assert resp.status_code == 200
+    assert len(requests) == 2
+    assert sleeps == [3.0]
+
+
+def test_gives_up_after_max_attempts(mock_http, sleeps):
+    requests = mock_http(lambda request: httpx.Response(429))
+    resp = asyncio.run(http.get_with_retry("https://example.com"))
+
+    assert resp.status_code == 429
+    assert len(requests) == http.MAX_ATTEMPTS
+    assert sleeps == [1.0, 2.0, 4.0]
+
+
+@pytest.mark.parametrize(
+    "retry_after,expected",
+    [("soon", 1.0), ("99999", http.MAX_RETRY_DELAY), ("-5", 0.0)],
+    ids=["non-numeric", "oversized", "negative"],
+)
+def test_retry_after_is_parsed_and_clamped(mock_http, sleeps, retry_after, expected):
+    mock_http(_responses(httpx.Response(429, headers={"Retry-After": retry_after}), httpx.Response(200)))
+    asyncio.run(http.get_with_retry("https://example.com"))
+
+    assert sleeps == [expected]
+
+
+def test_numeric_timeout_keeps_unbounded_pool_wait(mock_http):
+    requests = mock_http(lambda request: httpx.Response(200))
+    asyncio.run(http.get_with_retry("https://example.com", timeout=30))
+
+    assert requests[0].extensions["timeout"] == {"connect": 30, "read": 30, "write": 30, "pool": None}
+
+
+def test_shared_client_defaults_to_unbounded_pool_wait(monkeypatch):
+    monkeypatch.setattr(http, "_client", None)
+    client = http.get_http_client()
+
+    assert client.timeout.pool is None
+    assert http.get_http_client() is client
+    asyncio.run(http.close_http_client())
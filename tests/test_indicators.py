@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import kernels
+from analysis.kernels import indicator_pass
+from analysis.technical import IndicatorState, bollinger_bands, bollinger_last, ema, macd, macd_last, rsi
+from analysis.trend import detect_trend
+from strategy.signals import generate_signals_batch
+
+CLOSES = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 300))
+
+
+def _pandas_last():
+    series = pd.Series(CLOSES)
+    return (
+        rsi(series).iloc[-1],
+        ema(series).iloc[-1],
+        *macd(series).iloc[-1],
+        *bollinger_bands(series).iloc[-1],
+    )
+
+
+def test_streaming_matches_pandas():
+    state = IndicatorState()
+    for close in CLOSES:
+        state.update(close)
+    np.testing.assert_allclose((state.rsi, state.ema, *state.macd, *state.bollinger), _pandas_last(), rtol=1e-9)
+
+
+def test_from_closes_matches_streaming():
+    streamed = IndicatorState()
+    for close in CLOSES[:250]:
+        streamed.update(close)
+    state = IndicatorState.from_closes(CLOSES[:250])
+    for close in CLOSES[250:]:
+        streamed.update(close)
+        state.update(close)
+    assert state.count == streamed.count
+    np.testing.assert_allclose(
+        (state.rsi, state.ema, *state.macd, *state.bollinger),
+        (streamed.rsi, streamed.ema, *streamed.macd, *streamed.bollinger),
+        rtol=1e-9,
+    )
+
+
+def test_indicator_pass_matches_pandas():
+    ema_fast, ema_slow, signal, ema_val, avg_gain, avg_loss = indicator_pass(CLOSES, 14, 12, 26, 9, 20)
+    macd_line = ema_fast - ema_slow
+    rsi_val = 100 - 100 / (1 + avg_gain / avg_loss)
+    expected = _pandas_last()
+    np.testing.assert_allclose((rsi_val, ema_val, macd_line, signal, macd_line - signal), expected[:5], rtol=1e-9)
+
+
+def test_last_value_helpers_match_pandas():
+    series = pd.Series(CLOSES)
+    np.testing.assert_allclose(macd_last(CLOSES), macd(series).iloc[-1], rtol=1e-9)
+    np.testing.assert_allclose(bollinger_last(CLOSES), bollinger_bands(series).iloc[-1], rtol=1e-9)
+    np.testing.assert_allclose(macd_last(CLOSES, 5, 10, 3), macd(series, 5, 10, 3).iloc[-1], rtol=1e-9)
+    np.testing.assert_allclose(bollinger_last(CLOSES, 10, 1.5), bollinger_bands(series, 10, 1.5).iloc[-1], rtol=1e-9)
+    assert np.isnan(bollinger_last(CLOSES[:5])).all()
+
+
+def test_signal_batch_matches_pandas():
+    prices = np.asfortranarray(np.column_stack([CLOSES, CLOSES[::-1], CLOSES]).astype(np.float32))
+    batch = generate_signals_batch(["A", "B", "C"], prices, np.zeros(3), np.zeros(3))
+    expected = pd.Series(CLOSES.astype(np.float32).astype(np.float64))
+    np.testing.assert_allclose(
+        (batch.rsi[0], batch.ema[0], batch.macd_line[0], batch.macd_signal[0], batch.bb_upper[0], batch.bb_sma[0]),
+        (
+            rsi(expected).iloc[-1],
+            ema(expected).iloc[-1],
+            *macd(expected).iloc[-1, :2],
+            *bollinger_bands(expected).iloc[-1, :2],
+        ),
+        rtol=1e-5,
+    )
+    assert batch.direction[0] == kernels.direction_code(float(batch.confidence[0]))
+
+
+@pytest.mark.parametrize("short,long", [(50, 200), (1, 5), (5, 1), (20, 20), (50, 400)])
+def test_detect_trend_matches_rolling_means(short, long):
+    series = pd.Series(CLOSES)
+    ma_short = series.rolling(window=short).mean().iloc[-1]
+    ma_long = series.rolling(window=long).mean().iloc[-1]
+    expected = "bull" if ma_short > ma_long else "bear" if ma_short < ma_long else "neutral"
+    assert detect_trend(CLOSES, short, long) == expected
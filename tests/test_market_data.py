@@ -0,0 +1,76 @@
+import asyncio
+
+import httpx
+import numpy as np
+import orjson
+
+from data.market_data import PRICE_BATCH_SIZE, fetch_price_data_batch, parse_closes
+
+
+def _bars(*closes):
+    return {"values": [{"close": str(c)} for c in reversed(closes)]}
+
+
+def _twelvedata(request):
+    symbols = request.url.params["symbol"].split(",")
+    if len(symbols) == 1:
+        return httpx.Response(200, content=orjson.dumps(_bars(1.0, 2.0)))
+    return httpx.Response(200, content=orjson.dumps({s: _bars(1.0, 2.0) for s in symbols}))
+
+
+def test_batch_is_chunked_to_the_symbol_limit(mock_http):
+    symbols = [f"S{i}" for i in range(PRICE_BATCH_SIZE + 2)]
+    requests = mock_http(_twelvedata)
+    results = asyncio.run(fetch_price_data_batch(symbols))
+
+    chunk_sizes = sorted(len(r.url.params["symbol"].split(",")) for r in requests)
+    assert chunk_sizes == [2, PRICE_BATCH_SIZE]
+    assert list(results) == symbols
+
+
+def test_single_symbol_chunk_is_keyed_by_symbol(mock_http):
+    requests = mock_http(_twelvedata)
+    results = asyncio.run(fetch_price_data_batch(["AAPL"]))
+
+    assert len(requests) == 1
+    assert parse_closes(results["AAPL"]).tolist() == [1.0, 2.0]
+
+
+def test_failed_symbol_falls_back_to_alphavantage(mock_http):
+    alphavantage = {"Time Series (Daily)": {"2024-01-02": {"4. close": "5.0"}}}
+
+    def handler(request):
+        if request.url.host == "www.alphavantage.co":
+            assert request.url.params["symbol"] == "BAD"
+            return httpx.Response(200, content=orjson.dumps(alphavantage))
+        payload = {"GOOD": _bars(1.0), "BAD": {"status": "error", "message": "not found"}}
+        return httpx.Response(200, content=orjson.dumps(payload))
+
+    requests = mock_http(handler)
+    results = asyncio.run(fetch_price_data_batch(["GOOD", "BAD"]))
+
+    assert [r.url.host for r in requests] == ["api.twelvedata.com", "www.alphavantage.co"]
+    assert results["GOOD"] == _bars(1.0)
+    assert results["BAD"] == alphavantage
+
+
+def test_parse_closes_alphavantage_oldest_first():
+    payload = {
+        "Time Series (Daily)": {
+            "2024-01-03": {"4. close": "3.5"},
+            "2024-01-02": {"4. close": "2.5"},
+        }
+    }
+    closes = parse_closes(payload)
+    assert closes.dtype == np.float32
+    assert closes.tolist() == [2.5, 3.5]
+
+
+def test_parse_closes_without_series_is_empty():
+    assert parse_closes({}).size == 0
+    assert parse_closes({"Note": "API call frequency exceeded"}).size == 0
+    assert parse_closes({}).dtype == np.float32
+
+
+def test_twelvedata_closes_oldest_first():
+    assert parse_closes(_bars(1.0, 2.0, 3.0)).tolist() == [1.0, 2.0, 3.0]
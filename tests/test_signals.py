@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from strategy.signals import generate_signals_batch, stack_closes
+
+
+@pytest.mark.parametrize(
+    "closes",
+    [
+        [],
+        [np.linspace(100, 120, 60)],
+        [np.array([100.0]), np.array([50.0])],
+        [np.array([100.0])],
+        [np.array([]), np.linspace(100, 120, 60)],
+    ],
+    ids=["no-symbols", "one-symbol", "one-bar", "one-symbol-one-bar", "empty-history"],
+)
+def test_generate_signals_batch_degenerate_shapes(closes):
+    symbols = [f"S{i}" for i in range(len(closes))]
+    batch = generate_signals_batch(symbols, stack_closes(closes), np.zeros(len(symbols)), np.zeros(len(symbols)))
+    assert len(batch) == len(symbols)
+    assert batch.direction.shape == batch.confidence.shape == (len(symbols),)
+    assert [s.symbol for s in batch.to_signals()] == symbols
+
+
+@pytest.mark.parametrize(
+    "symbols,price_matrix,n_scores",
+    [
+        (["A", "B", "C"], np.ones((60, 3)), 1),
+        (["A"], np.ones((60, 3)), 1),
+        (["A", "B"], np.ones((60, 2)), 3),
+        (["A"], np.ones(60), 1),
+    ],
+    ids=["short-scores", "extra-columns", "long-scores", "1-d-prices"],
+)
+def test_generate_signals_batch_rejects_mismatched_sizes(symbols, price_matrix, n_scores):
+    with pytest.raises(ValueError):
+        generate_signals_batch(symbols, price_matrix, np.zeros(n_scores), np.zeros(len(symbols)))
+
+
+def test_top_k_ranks_by_confidence_with_nan_last():
+    closes = [np.linspace(100, 120, 60), np.array([]), np.linspace(100, 120, 60), np.linspace(100, 120, 60)]
+    ai_scores = np.array([0.2, 1.0, 0.9, 0.5])
+    batch = generate_signals_batch(["A", "B", "C", "D"], stack_closes(closes), ai_scores, np.zeros(4))
+    assert np.isnan(batch.confidence[1])
+
+    assert batch.top_k(2).tolist() == [2, 3]
+    assert batch.top_k(10).tolist() == [2, 3, 0, 1]
+    assert batch.top_k(0).size == 0
+    assert batch.top_k(-1).size == 0